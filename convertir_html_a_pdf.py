@@ -4,10 +4,37 @@ Script para convertir el HTML modificado a PDF usando WeasyPrint
 """
 
 import os
+import sys
 from weasyprint import HTML, CSS
 from weasyprint.text.fonts import FontConfiguration
+from linealizar_pdf import linealizar_pdf
+from optimizar_html_manual import comparar_renderizado, optimizar_html
 
-def convertir_html_a_pdf():
+# CSS adicional para mejorar la conversión (compartido con generar_variantes_manual.py)
+CSS_ADICIONAL = '''
+    @page {
+        size: A4;
+        margin: 20mm;
+    }
+    
+    body {
+        font-family: 'Segoe UI', 'Arial', sans-serif;
+    }
+    
+    .portada {
+        page-break-after: always;
+    }
+    
+    h1, h2, h3 {
+        page-break-after: avoid;
+    }
+    
+    table {
+        page-break-inside: avoid;
+    }
+'''
+
+def convertir_html_a_pdf(linealizar=False, optimizar=False):
     """Convierte el HTML modificado a PDF manteniendo el diseño original"""
     
     archivo_html = "Manual_Usuario_EspacioDeportivoBordeRio.html"
@@ -25,38 +52,42 @@ def convertir_html_a_pdf():
         font_config = FontConfiguration()
         
         # CSS adicional para mejorar la conversión
-        css_adicional = CSS(string='''
-            @page {
-                size: A4;
-                margin: 20mm;
-            }
-            
-            body {
-                font-family: 'Segoe UI', 'Arial', sans-serif;
-            }
-            
-            .portada {
-                page-break-after: always;
-            }
-            
-            h1, h2, h3 {
-                page-break-after: avoid;
-            }
-            
-            table {
-                page-break-inside: avoid;
-            }
-        ''', font_config=font_config)
+        css_adicional = CSS(string=CSS_ADICIONAL, font_config=font_config)
         
         print("🔄 Convirtiendo HTML a PDF...")
         
         # Convertir HTML a PDF
-        html_doc = HTML(filename=archivo_html)
-        html_doc.write_pdf(
-            archivo_pdf,
-            stylesheets=[css_adicional],
-            font_config=font_config
-        )
+        if optimizar:
+            # Podar CSS sin uso y minificar en memoria; el HTML en disco no cambia
+            print("✂️  Podando CSS no usado y minificando el HTML...")
+            with open(archivo_html, 'r', encoding='utf-8') as file:
+                original = file.read()
+            contenido, conteo = optimizar_html(original)
+            print(f"📊 Reglas CSS: {conteo['antes']} → {conteo['despues']}")
+            
+            # Se renderizan ambas versiones para comparar; se escribe el layout
+            # ya hecho de la optimizada, sin volver a renderizarla
+            documento = comparar_renderizado(
+                original,
+                contenido,
+                os.path.dirname(os.path.abspath(archivo_html))
+            )
+            if documento is None:
+                print("❌ Error: La optimización cambió el documento, no se escribe el PDF")
+                return False
+            documento.write_pdf(archivo_pdf)
+        else:
+            html_doc = HTML(filename=archivo_html)
+            html_doc.write_pdf(
+                archivo_pdf,
+                stylesheets=[css_adicional],
+                font_config=font_config
+            )
+        
+        # WeasyPrint no genera PDFs linealizados, se post-procesa el archivo
+        if linealizar and not linealizar_pdf(archivo_pdf):
+            print("❌ Error: No se pudo linealizar el PDF")
+            return False
         
         # Verificar que el PDF se creó correctamente
         if os.path.exists(archivo_pdf):
@@ -80,7 +111,10 @@ if __name__ == "__main__":
     print("🎨 Manteniendo el diseño original con gradiente morado...")
     print("-" * 60)
     
-    if convertir_html_a_pdf():
+    if convertir_html_a_pdf(
+        linealizar='--linearize' in sys.argv,
+        optimizar='--optimizar' in sys.argv
+    ):
         print("-" * 60)
         print("🎉 ¡Proceso completado exitosamente!")
         print("💡 El PDF ahora tiene el diseño original sin logos.")
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Script para dividir el manual en PDFs por sección con un índice JSON de descarga
+"""
+
+import fitz  # PyMuPDF
+import html
+import json
+import os
+import re
+import sys
+import unicodedata
+from linealizar_pdf import linealizar_pdf
+
+# Los <h1> del manual usan 24pt; el texto del índice es bastante menor
+TAMANO_MINIMO_TITULO = 18
+
+
+def _normalizar(texto):
+    """Normaliza un título para compararlo (sin acentos, minúsculas, espacios simples)"""
+    texto = unicodedata.normalize('NFKD', texto)
+    texto = ''.join(c for c in texto if not unicodedata.combining(c))
+    return re.sub(r'\s+', ' ', texto).strip().lower()
+
+
+def _slug(texto):
+    """Convierte un título en un nombre de archivo seguro"""
+    return re.sub(r'[^a-z0-9]+', '-', _normalizar(texto)).strip('-')
+
+
+def obtener_titulos_html(archivo_html):
+    """Extrae los títulos <h1> del HTML del manual en orden"""
+
+    with open(archivo_html, 'r', encoding='utf-8') as file:
+        contenido = file.read()
+
+    titulos = []
+    for bruto in re.findall(r'<h1[^>]*>(.*?)</h1>', contenido, flags=re.DOTALL | re.IGNORECASE):
+        titulo = html.unescape(re.sub(r'<[^>]+>', ' ', bruto))
+        titulo = re.sub(r'\s+', ' ', titulo).strip()
+        if titulo:
+            titulos.append(titulo)
+    return titulos
+
+
+def _pagina_con_titulo(doc, titulo, desde):
+    """Busca la primera página donde el título aparece como encabezado"""
+
+    clave = _normalizar(titulo)
+    for numero in range(desde, len(doc)):
+        text_dict = doc[numero].get_text("dict")
+        for block in text_dict["blocks"]:
+            for line in block.get("lines", []):
+                texto = ''.join(span["text"] for span in line["spans"])
+                tamano = max((span["size"] for span in line["spans"]), default=0)
+                # El índice también lista los títulos, pero en letra normal
+                if tamano >= TAMANO_MINIMO_TITULO and _normalizar(texto) == clave:
+                    return numero
+    return None
+
+
+def _ubicar_secciones(doc, titulos):
+    """Asocia cada título a su página inicial usando el outline del PDF"""
+
+    # WeasyPrint genera un marcador por cada <h1>; los de nivel 1 bastan
+    marcadores = {}
+    for nivel, titulo, pagina in doc.get_toc(simple=True):
+        if nivel == 1 and pagina > 0:
+            marcadores.setdefault(_normalizar(titulo), pagina - 1)
+
+    # Sin HTML, el outline es la única fuente de secciones
+    if not titulos:
+        titulos = [titulo for nivel, titulo, pagina in doc.get_toc(simple=True) if nivel == 1]
+
+    secciones = []
+    pagina_minima = 0
+    for titulo in titulos:
+        inicio = marcadores.get(_normalizar(titulo))
+
+        if inicio is None:
+            # Respaldo para PDFs sin outline (p. ej. impresos desde el navegador)
+            inicio = _pagina_con_titulo(doc, titulo, pagina_minima)
+
+        if inicio is None or inicio < pagina_minima:
+            print(f"   ⚠️  No se encontró la página de la sección: '{titulo}'")
+            continue
+
+        secciones.append({'titulo': titulo, 'inicio': inicio})
+        pagina_minima = inicio
+
+    # Cada sección termina donde empieza la siguiente
+    for actual, siguiente in zip(secciones, secciones[1:] + [None]):
+        fin = siguiente['inicio'] - 1 if siguiente else len(doc) - 1
+        actual['fin'] = max(fin, actual['inicio'])
+
+    return secciones
+
+
+def dividir_manual(archivo_pdf, archivo_html=None, carpeta_salida=None, linealizar=False):
+    """Escribe un PDF por sección y un índice JSON con archivo, páginas y tamaño"""
+
+    base = os.path.splitext(os.path.basename(archivo_pdf))[0]
+    carpeta_salida = carpeta_salida or f"{base}_secciones"
+    archivo_indice = os.path.join(carpeta_salida, "indice_secciones.json")
+
+    try:
+        if not os.path.exists(archivo_pdf):
+            print(f"Error: No se encontró el archivo {archivo_pdf}")
+            return False
+
+        titulos = []
+        if archivo_html:
+            if not os.path.exists(archivo_html):
+                print(f"Error: No se encontró el archivo {archivo_html}")
+                return False
+            print("📖 Leyendo los títulos <h1> del HTML...")
+            titulos = obtener_titulos_html(archivo_html)
+            print(f"🔍 Encontrados {len(titulos)} títulos de sección")
+
+        print("📖 Abriendo el PDF del manual...")
+        doc = fitz.open(archivo_pdf)
+
+        secciones = _ubicar_secciones(doc, titulos)
+        if not secciones:
+            print("Error: No se encontraron secciones en el PDF")
+            doc.close()
+            return False
+
+        os.makedirs(carpeta_salida, exist_ok=True)
+
+        indice = {
+            'manual': os.path.basename(archivo_pdf),
+            'paginas': len(doc),
+            'bytes': os.path.getsize(archivo_pdf),
+            'secciones': [],
+        }
+
+        print(f"✂️  Dividiendo en {len(secciones)} secciones...")
+        for numero, seccion in enumerate(secciones, start=1):
+            nombre = f"{numero:02d}-{_slug(seccion['titulo']) or 'seccion'}.pdf"
+            ruta = os.path.join(carpeta_salida, nombre)
+
+            parte = fitz.open()
+            parte.insert_pdf(doc, from_page=seccion['inicio'], to_page=seccion['fin'])
+            parte.set_metadata({**doc.metadata, 'title': seccion['titulo']})
+            parte.set_toc([[1, seccion['titulo'], 1]])
+
+            # Cada sección solo necesita los glifos que usa; garbage=4 además
+            # fusiona objetos duplicados (fuentes e imágenes repetidas entre
+            # páginas) para que las páginas de la sección los compartan
+            parte.subset_fonts()
+            parte.save(ruta, garbage=4, deflate=True)
+            parte.close()
+
+            if linealizar and not linealizar_pdf(ruta):
+                print(f"   ⚠️  No se pudo linealizar {nombre}")
+
+            tamano = os.path.getsize(ruta)
+            indice['secciones'].append({
+                'titulo': seccion['titulo'],
+                'archivo': nombre,
+                'pagina_inicio': seccion['inicio'] + 1,
+                'pagina_fin': seccion['fin'] + 1,
+                'bytes': tamano,
+            })
+            print(f"   📄 {nombre}: páginas {seccion['inicio'] + 1}-{seccion['fin'] + 1} ({tamano:,} bytes)")
+
+        doc.close()
+
+        print("💾 Guardando el índice de secciones...")
+        with open(archivo_indice, 'w', encoding='utf-8') as file:
+            json.dump(indice, file, ensure_ascii=False, indent=2)
+
+        total = sum(s['bytes'] for s in indice['secciones'])
+        print(f"✅ Manual dividido exitosamente!")
+        print(f"📁 Carpeta de secciones: {carpeta_salida}")
+        print(f"📁 Índice: {archivo_indice}")
+        print(f"📊 Manual completo: {indice['bytes']:,} bytes | Suma de secciones: {total:,} bytes")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Error al dividir el manual: {str(e)}")
+        return False
+
+
+if __name__ == "__main__":
+    argumentos = [a for a in sys.argv[1:] if not a.startswith('--')]
+    archivo_pdf = argumentos[0] if argumentos else "Manual_Usuario_EspacioDeportivoBordeRio.pdf"
+    archivo_html = argumentos[1] if len(argumentos) > 1 else os.path.splitext(archivo_pdf)[0] + ".html"
+
+    print("🚀 Dividiendo el Manual de Usuario por secciones...")
+    print("-" * 60)
+
+    if dividir_manual(
+        archivo_pdf,
+        archivo_html if os.path.exists(archivo_html) else None,
+        linealizar='--linearize' in sys.argv
+    ):
+        print("-" * 60)
+        print("🎉 ¡Proceso completado exitosamente!")
+        print("💡 Cada sección puede descargarse por separado usando el índice JSON.")
+    else:
+        print("-" * 60)
+        print("❌ El proceso falló. Revisa los errores arriba.")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Script para generar varias variantes del manual con un único layout de WeasyPrint por diseño
+"""
+
+import copy
+import os
+import sys
+import time
+from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
+from convertir_html_a_pdf import CSS_ADICIONAL
+from linealizar_pdf import linealizar_pdf
+
+# HTML original (con logos) y el HTML publicado, el mismo que usa
+# convertir_html_a_pdf.py (sin logos y con su propia portada)
+ARCHIVO_HTML_CON_LOGOS = "Manual_Usuario_EspacioDeportivoBordeRio_backup.html"
+ARCHIVO_HTML = "Manual_Usuario_EspacioDeportivoBordeRio.html"
+
+# Cada variante indica el HTML del que sale (esto define el layout), además
+# de las páginas a escribir y los metadatos propios del PDF.
+# Las variantes con el mismo HTML comparten un único render().
+VARIANTES = [
+    {
+        'archivo': "Manual_Usuario_EspacioDeportivoBordeRio_con_logos.pdf",
+        'html': ARCHIVO_HTML_CON_LOGOS,
+        'paginas': None,
+        'titulo': "Manual de Usuario - Espacio Deportivo Borde Río",
+    },
+    {
+        'archivo': "Manual_Usuario_EspacioDeportivoBordeRio.pdf",
+        'html': ARCHIVO_HTML,
+        'paginas': None,
+        'titulo': "Manual de Usuario - Espacio Deportivo Borde Río",
+    },
+    {
+        'archivo': "Manual_Usuario_EspacioDeportivoBordeRio_sin_portada.pdf",
+        'html': ARCHIVO_HTML,
+        'paginas': slice(1, None),
+        'titulo': "Manual de Usuario - Espacio Deportivo Borde Río (sin portada)",
+    },
+]
+
+
+def _renderizar(archivo_html, font_config):
+    """Hace el layout completo del manual una sola vez"""
+
+    css_adicional = CSS(string=CSS_ADICIONAL, font_config=font_config)
+    html_doc = HTML(filename=archivo_html)
+    return html_doc.render(stylesheets=[css_adicional], font_config=font_config)
+
+
+def generar_variantes(variantes=VARIANTES, linealizar=False):
+    """Genera todas las variantes agrupándolas por layout"""
+
+    try:
+        # Agrupar las variantes que comparten el mismo layout
+        grupos = {}
+        for variante in variantes:
+            if not os.path.exists(variante['html']):
+                print(f"Error: No se encontró el archivo {variante['html']}")
+                return False
+            grupos.setdefault(variante['html'], []).append(variante)
+
+        print(f"📋 {len(variantes)} variantes, {len(grupos)} layout(s) distintos")
+
+        font_config = FontConfiguration()
+        tiempo_layout = 0
+        tiempo_escritura = 0
+
+        for archivo_html, grupo in grupos.items():
+            print(f"🔄 Haciendo el layout de {archivo_html}...")
+            inicio = time.perf_counter()
+            documento = _renderizar(archivo_html, font_config)
+            duracion = time.perf_counter() - inicio
+            tiempo_layout += duracion
+            print(f"   📄 {len(documento.pages)} páginas en {duracion:.2f} s")
+
+            for variante in grupo:
+                inicio = time.perf_counter()
+
+                paginas = documento.pages if variante['paginas'] is None else documento.pages[variante['paginas']]
+                salida = documento.copy(paginas)
+                # copy() comparte los metadatos con el documento base; cada variante lleva los suyos
+                salida.metadata = copy.copy(documento.metadata)
+                salida.metadata.title = variante['titulo']
+                salida.write_pdf(variante['archivo'])
+
+                if linealizar and not linealizar_pdf(variante['archivo']):
+                    print(f"   ⚠️  No se pudo linealizar {variante['archivo']}")
+
+                duracion = time.perf_counter() - inicio
+                tiempo_escritura += duracion
+                tamano = os.path.getsize(variante['archivo'])
+                print(f"   💾 {variante['archivo']}: {len(paginas)} páginas, "
+                      f"{tamano:,} bytes ({duracion:.2f} s)")
+
+        print(f"✅ Variantes generadas exitosamente!")
+        print(f"⏱️  Layout: {tiempo_layout:.2f} s ({len(grupos)} render) | Escritura: {tiempo_escritura:.2f} s")
+        print(f"💡 Sin compartir layout se habrían hecho {len(variantes)} render()")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Error al generar las variantes: {str(e)}")
+        return False
+
+
+if __name__ == "__main__":
+    print("🚀 Generando variantes del Manual de Usuario...")
+    print("🎨 Un solo layout por diseño, varias salidas PDF...")
+    print("-" * 60)
+
+    if generar_variantes(linealizar='--linearize' in sys.argv):
+        print("-" * 60)
+        print("🎉 ¡Proceso completado exitosamente!")
+    else:
+        print("-" * 60)
+        print("❌ El proceso falló. Revisa los errores arriba.")
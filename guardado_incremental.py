@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Script para guardar ediciones pequeñas de PDFs de forma incremental y compactarlas después
+
+Uso:
+    python guardado_incremental.py --compact [--linearize] archivo.pdf [...]
+"""
+
+import fitz  # PyMuPDF
+import os
+import shutil
+import sys
+import time
+from linealizar_pdf import linealizar_pdf
+
+
+def guardar_pdf_completo(doc, archivo_pdf, **opciones):
+    """Reescribe el PDF completo en un temporal y lo reemplaza de forma atómica
+
+    PyMuPDF no permite guardar completo sobre el archivo abierto, solo en modo
+    incremental. Se conservan los permisos del original.
+    """
+
+    temporal = archivo_pdf + ".tmp"
+    try:
+        doc.save(temporal, **opciones)
+        if os.path.exists(archivo_pdf):
+            shutil.copymode(archivo_pdf, temporal)
+        os.replace(temporal, archivo_pdf)
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+
+
+def guardar_incremental(doc, archivo_pdf, medir=False):
+    """Agrega al final del archivo solo los objetos modificados
+
+    Con medir=True también serializa el documento completo en memoria para
+    comparar con una reescritura (cuesta tanto como esa reescritura).
+    Devuelve False si el PDF no admitía guardado incremental y se reescribió completo.
+    """
+
+    if not doc.can_save_incrementally():
+        # MuPDF no permite actualizaciones incrementales sobre archivos reparados o recifrados
+        print("⚠️  El PDF no admite guardado incremental, se reescribe completo")
+        guardar_pdf_completo(doc, archivo_pdf)
+        return False
+
+    tamano_anterior = os.path.getsize(archivo_pdf)
+
+    if medir:
+        # Reescritura completa solo en memoria, para comparar
+        inicio = time.perf_counter()
+        bytes_completo = len(doc.tobytes())
+        tiempo_completo = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    doc.saveIncr()
+    tiempo_incremental = time.perf_counter() - inicio
+
+    bytes_incremental = os.path.getsize(archivo_pdf) - tamano_anterior
+    print(f"📊 Guardado incremental: {bytes_incremental:,} bytes escritos en {tiempo_incremental * 1000:.0f} ms "
+          f"(archivo de {tamano_anterior:,} bytes)")
+    if medir:
+        print(f"📊 Reescritura completa: {bytes_completo:,} bytes en {tiempo_completo * 1000:.0f} ms")
+    print("💡 Usa 'python guardado_incremental.py --compact' para integrar los cambios más adelante")
+
+    return True
+
+
+def compactar_pdf(archivo_pdf, linealizar=False):
+    """Integra las actualizaciones incrementales en una única versión limpia del archivo"""
+
+    try:
+        if not os.path.exists(archivo_pdf):
+            print(f"Error: No se encontró el archivo {archivo_pdf}")
+            return False
+
+        tamano_anterior = os.path.getsize(archivo_pdf)
+
+        print(f"🗜️  Compactando {archivo_pdf}...")
+        inicio = time.perf_counter()
+        with fitz.open(archivo_pdf) as doc:
+            # garbage=3 elimina los objetos que quedaron sin uso tras las ediciones
+            guardar_pdf_completo(doc, archivo_pdf, garbage=3, deflate=True)
+        duracion = time.perf_counter() - inicio
+
+        print(f"📊 Tamaño: {tamano_anterior:,} → {os.path.getsize(archivo_pdf):,} bytes ({duracion:.2f} s)")
+
+        # Un guardado incremental invalida la linealización; se vuelve a aplicar aquí
+        if linealizar and not linealizar_pdf(archivo_pdf):
+            print("❌ Error: No se pudo linealizar el PDF")
+            return False
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Error al compactar el PDF: {str(e)}")
+        return False
+
+
+if __name__ == "__main__":
+    archivos = [a for a in sys.argv[1:] if not a.startswith('--')]
+
+    if '--compact' not in sys.argv or not archivos:
+        print(__doc__.strip())
+        sys.exit(1)
+
+    print("🚀 Compactando PDFs con actualizaciones incrementales...")
+    print("-" * 60)
+
+    correctos = sum(compactar_pdf(archivo, linealizar='--linearize' in sys.argv) for archivo in archivos)
+
+    print("-" * 60)
+    if correctos == len(archivos):
+        print("🎉 ¡Proceso completado exitosamente!")
+    else:
+        print(f"❌ {len(archivos) - correctos} archivo(s) con problemas. Revisa los errores arriba.")
+        sys.exit(1)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Script para indexar el texto de los manuales PDF y buscar temas (manual, página y fragmento)
+
+Uso:
+    python indice_busqueda_manuales.py indexar [archivo.pdf ...]
+    python indice_busqueda_manuales.py buscar "consulta"
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+
+ARCHIVO_INDICE = "indice_busqueda_manuales.json"
+VERSION_INDICE = 1
+LARGO_FRAGMENTO = 160
+PATRON_TERMINO = re.compile(r'\w+')
+
+
+def plegar(texto):
+    """Pasa a minúsculas y quita los acentos ("Río" → "rio")"""
+    texto = unicodedata.normalize('NFKD', texto.lower())
+    return ''.join(c for c in texto if not unicodedata.combining(c))
+
+
+def _plegar_con_posiciones(texto):
+    """Pliega el texto carácter a carácter y devuelve también la posición original de cada carácter"""
+    plegado = []
+    posiciones = []
+    for posicion, caracter in enumerate(texto):
+        for c in plegar(caracter):
+            plegado.append(c)
+            posiciones.append(posicion)
+    return ''.join(plegado), posiciones
+
+
+def _terminos(texto):
+    """Divide un texto en términos plegados"""
+    return PATRON_TERMINO.findall(plegar(texto))
+
+
+def _hash_archivo(ruta):
+    """Calcula el SHA-256 del archivo"""
+    sha = hashlib.sha256()
+    with open(ruta, 'rb') as archivo:
+        for bloque in iter(lambda: archivo.read(1024 * 1024), b''):
+            sha.update(bloque)
+    return sha.hexdigest()
+
+
+def cargar_indice(archivo_indice=ARCHIVO_INDICE):
+    """Carga el índice persistente, o uno vacío si no existe o es de otra versión"""
+    if os.path.exists(archivo_indice):
+        with open(archivo_indice, 'r', encoding='utf-8') as file:
+            indice = json.load(file)
+        if indice.get('version') == VERSION_INDICE:
+            return indice
+    return {'version': VERSION_INDICE, 'manuales': {}}
+
+
+def _indexar_pdf(ruta):
+    """Extrae el texto por página con PyMuPDF y construye el índice invertido del manual"""
+    # Importación local: las búsquedas no necesitan PyMuPDF
+    import fitz  # PyMuPDF
+
+    paginas = []
+    terminos = {}
+    with fitz.open(ruta) as doc:
+        for numero, page in enumerate(doc, start=1):
+            texto = re.sub(r'\s+', ' ', page.get_text("text")).strip()
+            paginas.append(texto)
+            for termino in set(_terminos(texto)):
+                terminos.setdefault(termino, []).append(numero)
+    return paginas, terminos
+
+
+def indexar_manuales(archivos=None, archivo_indice=ARCHIVO_INDICE):
+    """Actualiza el índice reindexando solo los PDFs cuyo hash cambió"""
+
+    archivos = archivos or sorted(glob.glob("Manual*.pdf"))
+
+    try:
+        indice = cargar_indice(archivo_indice)
+        manuales = indice['manuales']
+
+        # Quitar del índice los manuales que ya no existen
+        eliminados = [n for n in manuales if not os.path.exists(n)]
+        for nombre in eliminados:
+            print(f"   🗑️  Eliminado del índice: {nombre}")
+            del manuales[nombre]
+
+        reindexados = 0
+        for ruta in archivos:
+            if not os.path.exists(ruta):
+                print(f"   ⚠️  No se encontró el archivo {ruta}")
+                continue
+
+            sha = _hash_archivo(ruta)
+            if manuales.get(ruta, {}).get('sha256') == sha:
+                print(f"   ✅ Sin cambios: {ruta}")
+                continue
+
+            print(f"   🔄 Indexando: {ruta}")
+            paginas, terminos = _indexar_pdf(ruta)
+            manuales[ruta] = {'sha256': sha, 'paginas': paginas, 'terminos': terminos}
+            reindexados += 1
+
+        if reindexados or eliminados:
+            print("💾 Guardando el índice...")
+            with open(archivo_indice, 'w', encoding='utf-8') as file:
+                json.dump(indice, file, ensure_ascii=False, separators=(',', ':'))
+
+        total_terminos = sum(len(m['terminos']) for m in manuales.values())
+        print(f"✅ Índice actualizado: {len(manuales)} manuales, {reindexados} reindexados")
+        print(f"📊 Términos indexados: {total_terminos:,}")
+        print(f"📁 Archivo de índice: {archivo_indice}")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Error al indexar los manuales: {str(e)}")
+        return False
+
+
+def _fragmento(texto, termino):
+    """Devuelve un fragmento del texto original alrededor de la primera aparición del término"""
+    plegado, posiciones = _plegar_con_posiciones(texto)
+    coincidencia = re.search(r'\b' + re.escape(termino) + r'\b', plegado)
+    if not coincidencia:
+        return texto[:LARGO_FRAGMENTO]
+
+    centro = posiciones[coincidencia.start()]
+    inicio = max(0, centro - LARGO_FRAGMENTO // 2)
+    fin = min(len(texto), inicio + LARGO_FRAGMENTO)
+    prefijo = '…' if inicio > 0 else ''
+    sufijo = '…' if fin < len(texto) else ''
+    return prefijo + texto[inicio:fin].strip() + sufijo
+
+
+def buscar(consulta, indice):
+    """Busca páginas que contengan todos los términos de la consulta"""
+
+    terminos = _terminos(consulta)
+    if not terminos:
+        return []
+
+    resultados = []
+    for nombre, manual in indice['manuales'].items():
+        paginas = None
+        for termino in terminos:
+            encontradas = set(manual['terminos'].get(termino, ()))
+            paginas = encontradas if paginas is None else paginas & encontradas
+            if not paginas:
+                break
+
+        for pagina in sorted(paginas or ()):
+            resultados.append({
+                'manual': nombre,
+                'pagina': pagina,
+                'fragmento': _fragmento(manual['paginas'][pagina - 1], terminos[0]),
+            })
+    return resultados
+
+
+def buscar_en_manuales(consulta, archivo_indice=ARCHIVO_INDICE):
+    """Muestra los resultados de una búsqueda en el índice"""
+
+    try:
+        if not os.path.exists(archivo_indice):
+            print(f"Error: No se encontró el índice {archivo_indice}")
+            print("💡 Ejecuta primero: python indice_busqueda_manuales.py indexar")
+            return False
+
+        inicio = time.perf_counter()
+        indice = cargar_indice(archivo_indice)
+        carga = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        resultados = buscar(consulta, indice)
+        duracion = time.perf_counter() - inicio
+
+        print(f"🔍 '{consulta}': {len(resultados)} resultado(s)")
+        for resultado in resultados:
+            print(f"   📄 {resultado['manual']} — página {resultado['pagina']}")
+            print(f"      {resultado['fragmento']}")
+        print(f"⏱️  Búsqueda: {duracion * 1000:.1f} ms (carga del índice: {carga * 1000:.1f} ms)")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Error al buscar en los manuales: {str(e)}")
+        return False
+
+
+if __name__ == "__main__":
+    comando = sys.argv[1] if len(sys.argv) > 1 else None
+
+    if comando == "indexar":
+        print("🚀 Actualizando el índice de búsqueda de los manuales...")
+        print("-" * 60)
+        exito = indexar_manuales(sys.argv[2:])
+    elif comando == "buscar" and len(sys.argv) > 2:
+        exito = buscar_en_manuales(' '.join(sys.argv[2:]))
+    else:
+        print(__doc__.strip())
+        sys.exit(1)
+
+    if not exito:
+        print("-" * 60)
+        print("❌ El proceso falló. Revisa los errores arriba.")
+        sys.exit(1)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Script para linealizar PDFs (vista web rápida) y verificar el resultado
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+# El diccionario de linealización debe estar en el primer objeto del archivo,
+# dentro de los primeros 1024 bytes según la especificación PDF
+BYTES_CABECERA = 1024
+PATRON_LINEARIZED = re.compile(rb'<<\s*/Linearized\s+[\d.]+(.*?)>>', re.DOTALL)
+
+
+def _entero(diccionario, clave):
+    """Obtiene un valor entero del diccionario de linealización"""
+    coincidencia = re.search(rb'/' + clave + rb'\s+(\d+)', diccionario)
+    return int(coincidencia.group(1)) if coincidencia else None
+
+
+def _linealizar_con_pikepdf(origen, destino):
+    """Linealiza usando pikepdf (qpdf como biblioteca)"""
+    import pikepdf
+
+    with pikepdf.open(origen) as pdf:
+        pdf.save(destino, linearize=True)
+
+
+def _linealizar_con_qpdf(origen, destino):
+    """Linealiza usando la herramienta de línea de comandos qpdf"""
+    resultado = subprocess.run(
+        ['qpdf', '--linearize', origen, destino],
+        capture_output=True,
+        text=True
+    )
+    # qpdf devuelve 3 cuando termina con advertencias pero genera el archivo
+    if resultado.returncode not in (0, 3):
+        raise RuntimeError(resultado.stderr.strip() or "qpdf falló")
+
+
+def linealizar_pdf(archivo_pdf, archivo_salida=None):
+    """Linealiza un PDF; si no se indica salida, reemplaza el archivo original"""
+
+    archivo_salida = archivo_salida or archivo_pdf
+
+    try:
+        if not os.path.exists(archivo_pdf):
+            print(f"Error: No se encontró el archivo {archivo_pdf}")
+            return False
+
+        print("🔗 Linealizando el PDF para vista web rápida...")
+
+        # Escribir primero a un temporal junto al destino para poder
+        # reemplazarlo de forma atómica
+        temporal = archivo_salida + ".tmp"
+
+        try:
+            try:
+                _linealizar_con_pikepdf(archivo_pdf, temporal)
+            except ImportError:
+                if shutil.which('qpdf') is None:
+                    print("⚠️  pikepdf y qpdf no están disponibles")
+                    print("💡 Instala uno de ellos para linealizar:")
+                    print("   - pip install pikepdf")
+                    print("   - apt install qpdf / brew install qpdf")
+                    return False
+                _linealizar_con_qpdf(archivo_pdf, temporal)
+
+            # Conservar los permisos del original (los PDFs se publican para descarga)
+            shutil.copymode(archivo_pdf, temporal)
+            os.replace(temporal, archivo_salida)
+        finally:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+
+        return verificar_linealizacion(archivo_salida) is not None
+
+    except Exception as e:
+        print(f"❌ Error al linealizar el PDF: {str(e)}")
+        return False
+
+
+def verificar_linealizacion(archivo_pdf):
+    """Verifica que el PDF esté linealizado e informa los bytes de la primera página"""
+
+    try:
+        with open(archivo_pdf, 'rb') as archivo:
+            cabecera = archivo.read(BYTES_CABECERA)
+        tamano = os.path.getsize(archivo_pdf)
+
+        coincidencia = PATRON_LINEARIZED.search(cabecera)
+        if not coincidencia:
+            print(f"❌ El PDF no está linealizado: {archivo_pdf}")
+            return None
+
+        diccionario = coincidencia.group(1)
+        info = {
+            'longitud': _entero(diccionario, rb'L'),
+            'fin_primera_pagina': _entero(diccionario, rb'E'),
+            'paginas': _entero(diccionario, rb'N'),
+            'objeto_primera_pagina': _entero(diccionario, rb'O'),
+            'tamano': tamano,
+        }
+
+        # /L debe coincidir con el tamaño real; si no, el archivo fue
+        # modificado después (p. ej. guardado incremental) y ya no es válido
+        if info['longitud'] != tamano:
+            print(f"❌ Linealización inválida: /L={info['longitud']} pero el archivo tiene {tamano:,} bytes")
+            return None
+
+        if info['fin_primera_pagina'] is None:
+            print("❌ Linealización inválida: falta la entrada /E")
+            return None
+
+        porcentaje = info['fin_primera_pagina'] / tamano * 100
+        print(f"✅ PDF linealizado: {archivo_pdf}")
+        print(f"📄 Páginas: {info['paginas']}")
+        print(f"📊 Bytes necesarios para mostrar la primera página: "
+              f"{info['fin_primera_pagina']:,} de {tamano:,} ({porcentaje:.1f}%)")
+
+        return info
+
+    except Exception as e:
+        print(f"❌ Error al verificar la linealización: {str(e)}")
+        return None
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Uso: python linealizar_pdf.py [--verificar] archivo.pdf [...]")
+        sys.exit(1)
+
+    solo_verificar = '--verificar' in sys.argv
+    archivos = [a for a in sys.argv[1:] if a != '--verificar']
+
+    print("🚀 Procesando linealización de PDFs...")
+    print("-" * 60)
+
+    correctos = 0
+    for archivo in archivos:
+        if solo_verificar:
+            correctos += verificar_linealizacion(archivo) is not None
+        else:
+            correctos += linealizar_pdf(archivo)
+
+    print("-" * 60)
+    if correctos == len(archivos):
+        print("🎉 ¡Proceso completado exitosamente!")
+    else:
+        print(f"❌ {len(archivos) - correctos} archivo(s) con problemas. Revisa los errores arriba.")
+        sys.exit(1)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Script para podar el CSS no usado y minificar el HTML del manual antes de renderizarlo
+"""
+
+import os
+import re
+import sys
+import time
+
+import cssselect2
+import tinycss2
+
+try:
+    # WeasyPrint >= 63 usa tinyhtml5; versiones anteriores usan html5lib
+    from tinyhtml5 import parse as parsear_html
+except ImportError:
+    from html5lib import parse as parsear_html
+
+# Bloques cuyo contenido no debe tocarse al colapsar espacios
+PATRON_BLOQUES_PROTEGIDOS = re.compile(
+    r'(<(pre|textarea|script|style)\b[^>]*>.*?</\2\s*>)',
+    flags=re.DOTALL | re.IGNORECASE
+)
+PATRON_ESTILO = re.compile(r'(<style\b[^>]*>)(.*?)(</style\s*>)', flags=re.DOTALL | re.IGNORECASE)
+PATRON_COMENTARIO = re.compile(r'<!--(?!\[if).*?-->', flags=re.DOTALL)
+
+
+def _separar_selectores(prelude):
+    """Divide el prelude de una regla en sus selectores (separados por comas)"""
+    selectores = [[]]
+    for token in prelude:
+        if token.type == 'literal' and token.value == ',':
+            selectores.append([])
+        else:
+            selectores[-1].append(token)
+    return selectores
+
+
+def _minificar_tokens(tokens):
+    """Quita comentarios y reduce los espacios a uno solo, también en bloques anidados"""
+    resultado = []
+    for token in tokens:
+        if token.type == 'comment':
+            continue
+        if token.type == 'whitespace':
+            token.value = ' '
+        if isinstance(getattr(token, 'arguments', None), list):
+            token.arguments = _minificar_tokens(token.arguments)
+        if isinstance(getattr(token, 'content', None), list):
+            token.content = _minificar_tokens(token.content)
+        resultado.append(token)
+    return resultado
+
+
+def _serializar(tokens):
+    """Serializa tokens CSS minificados"""
+    return tinycss2.serialize(_minificar_tokens(tokens)).strip()
+
+
+def _selector_usado(tokens, elementos):
+    """Indica si un selector coincide con algún elemento del documento"""
+    try:
+        compilados = cssselect2.compile_selector_list(tokens)
+    except cssselect2.SelectorError:
+        # Selector no soportado por cssselect2: conservarlo por seguridad
+        return True
+    return any(compilado.test(elemento) for compilado in compilados for elemento in elementos)
+
+
+def _podar_reglas(reglas, elementos, conteo):
+    """Elimina selectores sin coincidencias; devuelve el CSS resultante"""
+
+    salida = []
+    for regla in reglas:
+        if regla.type == 'qualified-rule':
+            conteo['antes'] += 1
+            usados = [
+                selector for selector in _separar_selectores(regla.prelude)
+                if _selector_usado(selector, elementos)
+            ]
+            if not usados:
+                continue
+            conteo['despues'] += 1
+            prelude = ','.join(_serializar(selector) for selector in usados)
+            salida.append(f"{prelude}{{{_serializar(regla.content)}}}")
+
+        elif regla.type == 'at-rule' and regla.lower_at_keyword == 'media' and regla.content is not None:
+            internas = tinycss2.parse_rule_list(regla.content, skip_whitespace=True, skip_comments=True)
+            contenido = _podar_reglas(internas, elementos, conteo)
+            if contenido:
+                salida.append(f"@media {_serializar(regla.prelude)}{{{contenido}}}")
+
+        elif regla.type == 'at-rule':
+            # @page, @font-face, etc. no dependen de los elementos del documento
+            contenido = '' if regla.content is None else f"{{{_serializar(regla.content)}}}"
+            fin = '' if contenido else ';'
+            salida.append(f"@{regla.at_keyword} {_serializar(regla.prelude)}{contenido}{fin}")
+
+    return ''.join(salida)
+
+
+def podar_css(contenido):
+    """Elimina del <style> embebido los selectores que no coinciden con el documento"""
+
+    # Parsear el documento una sola vez y reutilizar los elementos para todas las reglas
+    raiz = cssselect2.ElementWrapper.from_html_root(parsear_html(contenido))
+    elementos = list(raiz.iter_subtree())
+    conteo = {'antes': 0, 'despues': 0}
+
+    def reemplazar(coincidencia):
+        reglas = tinycss2.parse_stylesheet(coincidencia.group(2), skip_whitespace=True, skip_comments=True)
+        return coincidencia.group(1) + _podar_reglas(reglas, elementos, conteo) + coincidencia.group(3)
+
+    contenido = PATRON_ESTILO.sub(reemplazar, contenido)
+    return contenido, conteo
+
+
+def minificar_html(contenido):
+    """Quita comentarios y colapsa espacios fuera de <pre>, <textarea>, <script> y <style>"""
+
+    # Debe ejecutarse después de quitar_logos_html.py, que usa los comentarios como marcas
+    contenido = PATRON_COMENTARIO.sub('', contenido)
+
+    partes = PATRON_BLOQUES_PROTEGIDOS.split(contenido)
+    resultado = []
+    # split() con dos grupos devuelve: texto, bloque, nombre de etiqueta, texto, ...
+    for indice in range(0, len(partes), 3):
+        resultado.append(re.sub(r'\s+', ' ', partes[indice]))
+        if indice + 1 < len(partes):
+            resultado.append(partes[indice + 1])
+    return ''.join(resultado).strip()
+
+
+def optimizar_html(contenido):
+    """Aplica la poda de CSS y la minificación; devuelve el HTML y el conteo de reglas"""
+    contenido, conteo = podar_css(contenido)
+    return minificar_html(contenido), conteo
+
+
+def renderizar(contenido, base_url):
+    """Renderiza igual que convertir_html_a_pdf.py (CSS_ADICIONAL y FontConfiguration); devuelve (documento, segundos)"""
+    # Importación local: WeasyPrint solo hace falta para medir, no para optimizar
+    from weasyprint import HTML, CSS
+    from weasyprint.text.fonts import FontConfiguration
+    from convertir_html_a_pdf import CSS_ADICIONAL
+
+    font_config = FontConfiguration()
+    css_adicional = CSS(string=CSS_ADICIONAL, font_config=font_config)
+
+    inicio = time.perf_counter()
+    documento = HTML(string=contenido, base_url=base_url).render(
+        stylesheets=[css_adicional],
+        font_config=font_config
+    )
+    return documento, time.perf_counter() - inicio
+
+
+def comparar_renderizado(original, optimizado, base_url):
+    """Renderiza antes y después, informa tiempos y páginas; devuelve el documento optimizado o None si la paginación cambió"""
+
+    documento_original, tiempo_original = renderizar(original, base_url)
+    documento, tiempo = renderizar(optimizado, base_url)
+
+    print(f"⏱️  Renderizado: {tiempo_original:.2f} s → {tiempo:.2f} s")
+    print(f"📄 Páginas: {len(documento_original.pages)} → {len(documento.pages)}")
+    if len(documento_original.pages) != len(documento.pages):
+        print("❌ Error: El número de páginas cambió con la optimización")
+        return None
+    return documento
+
+
+def optimizar_manual(archivo_html, archivo_salida=None, medir=True):
+    """Genera una versión optimizada del HTML del manual e informa la mejora"""
+
+    archivo_salida = archivo_salida or os.path.splitext(archivo_html)[0] + "_optimizado.html"
+
+    try:
+        if not os.path.exists(archivo_html):
+            print(f"Error: No se encontró el archivo {archivo_html}")
+            return False
+
+        print("📖 Leyendo el archivo HTML...")
+        with open(archivo_html, 'r', encoding='utf-8') as file:
+            original = file.read()
+
+        print("✂️  Podando CSS no usado y minificando...")
+        inicio = time.perf_counter()
+        optimizado, conteo = optimizar_html(original)
+        duracion = time.perf_counter() - inicio
+
+        print(f"📊 Reglas CSS: {conteo['antes']} → {conteo['despues']} "
+              f"({conteo['antes'] - conteo['despues']} eliminadas)")
+        print(f"📊 Tamaño HTML: {len(original.encode('utf-8')):,} → "
+              f"{len(optimizado.encode('utf-8')):,} bytes")
+        print(f"⏱️  Optimización: {duracion * 1000:.0f} ms")
+
+        if medir:
+            base_url = os.path.dirname(os.path.abspath(archivo_html))
+            try:
+                documento = comparar_renderizado(original, optimizado, base_url)
+            except (ImportError, OSError):
+                print("⚠️  WeasyPrint no está disponible, se omite la medición del renderizado")
+            else:
+                if documento is None:
+                    print("❌ No se guarda el HTML optimizado")
+                    return False
+
+        print("💾 Guardando el HTML optimizado...")
+        with open(archivo_salida, 'w', encoding='utf-8') as file:
+            file.write(optimizado)
+
+        print(f"✅ HTML optimizado exitosamente!")
+        print(f"📁 Archivo HTML optimizado: {archivo_salida}")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ Error al optimizar el HTML: {str(e)}")
+        return False
+
+
+if __name__ == "__main__":
+    argumentos = [a for a in sys.argv[1:] if not a.startswith('--')]
+    archivo_html = argumentos[0] if argumentos else "Manual_Usuario_EspacioDeportivoBordeRio.html"
+
+    print("🚀 Optimizando el HTML del Manual de Usuario...")
+    print("🎨 Eliminando solo CSS sin uso, el diseño se mantiene igual...")
+    print("-" * 60)
+
+    if optimizar_manual(archivo_html, medir='--sin-medir' not in sys.argv):
+        print("-" * 60)
+        print("🎉 ¡Proceso completado exitosamente!")
+        print("💡 Usa 'python convertir_html_a_pdf.py --optimizar' para renderizar con esta etapa.")
+    else:
+        print("-" * 60)
+        print("❌ El proceso falló. Revisa los errores arriba.")
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Script para preparar las capturas de pantalla de los manuales (redimensionar, recomprimir y limpiar metadatos)
+
+Uso:
+    python procesar_capturas.py [--dpi 150] [--html Manual.html ...]
+
+El ancho impreso de cada captura se lee del <img> que la referencia en los HTML
+indicados con --html (atributo width o "width" en el style en línea). Si no hay
+referencia, se asume ANCHO_IMPRESO_MM según el nombre del archivo.
+
+El HTML de origen no se modifica: para cada --html se escribe una copia
+<nombre>_capturas.html junto a él, con las referencias apuntando a las
+capturas procesadas. Así el origen conserva los anchos y las rutas originales
+y el script puede volver a ejecutarse con otros ajustes (p. ej. --dpi 300).
+
+Nota: hoy ningún manual referencia las capturas por ruta (las únicas imágenes
+son los logos embebidos en base64), así que --html no genera ninguna copia
+hasta que un manual incluya capturas con <img src="Captura ...png">.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import quote, unquote
+
+from PIL import Image
+
+CARPETA_SALIDA = "capturas_procesadas"
+ARCHIVO_MANIFIESTO = os.path.join(CARPETA_SALIDA, "manifiesto.json")
+PATRONES_CAPTURAS = ["Captura movil *.png", "Captura pc *.png", "tu-imagen-*.png"]
+
+DPI_OBJETIVO = 150
+CALIDAD_JPEG = 85
+
+# Supuesto cuando ningún HTML indica el tamaño: ancho con que se imprime cada
+# tipo de captura (las de escritorio ocupan el ancho de texto de un A4 con
+# márgenes de 20mm; las de móvil, aproximadamente un tercio)
+ANCHO_IMPRESO_MM = {
+    'movil': 60,
+    'pc': 170,
+}
+ANCHO_TEXTO_MM = 170
+
+# Conversión a milímetros de las unidades CSS absolutas (1px CSS = 1/96 in)
+MM_POR_UNIDAD = {
+    'mm': 1,
+    'cm': 10,
+    'in': 25.4,
+    'pt': 25.4 / 72,
+    'px': 25.4 / 96,
+}
+PATRON_IMG = re.compile(r'<img\b[^>]*>', flags=re.IGNORECASE)
+
+
+def _tipo_captura(ruta):
+    """Determina si la captura es de móvil o de escritorio según su nombre"""
+    return 'movil' if 'movil' in os.path.basename(ruta).lower() else 'pc'
+
+
+def _atributo(etiqueta, nombre):
+    """Obtiene el valor de un atributo de una etiqueta HTML"""
+    coincidencia = re.search(r'\b' + nombre + r'\s*=\s*(["\'])(.*?)\1', etiqueta, flags=re.IGNORECASE | re.DOTALL)
+    return coincidencia.group(2) if coincidencia else None
+
+
+def _ancho_en_mm(etiqueta):
+    """Ancho impreso de un <img> según su style en línea o su atributo width, o None"""
+    estilo = _atributo(etiqueta, 'style') or ''
+    coincidencia = re.search(r'(?<![-\w])width\s*:\s*([\d.]+)\s*(mm|cm|in|pt|px|%)', estilo, flags=re.IGNORECASE)
+    if coincidencia:
+        valor, unidad = float(coincidencia.group(1)), coincidencia.group(2).lower()
+        return valor / 100 * ANCHO_TEXTO_MM if unidad == '%' else valor * MM_POR_UNIDAD[unidad]
+
+    ancho = _atributo(etiqueta, 'width')
+    if ancho and ancho.strip().isdigit():
+        return int(ancho) * MM_POR_UNIDAD['px']
+    return None
+
+
+def anchos_impresos_html(archivos_html):
+    """Lee de los HTML el ancho impreso (mm) de cada captura referenciada con <img src>"""
+    anchos = {}
+    for archivo_html in archivos_html:
+        if not os.path.exists(archivo_html):
+            continue
+        carpeta = os.path.dirname(os.path.abspath(archivo_html))
+        with open(archivo_html, 'r', encoding='utf-8') as file:
+            contenido = file.read()
+
+        for etiqueta in PATRON_IMG.findall(contenido):
+            src = _atributo(etiqueta, 'src')
+            ancho = _ancho_en_mm(etiqueta)
+            if not src or src.startswith('data:') or ancho is None:
+                continue
+            ruta = os.path.relpath(os.path.join(carpeta, unquote(src)))
+            # Si la captura aparece varias veces, manda la copia más grande
+            anchos[ruta] = max(ancho, anchos.get(ruta, 0))
+    return anchos
+
+
+def _ajustes(ruta, dpi, ancho_mm=None):
+    """Ajustes que determinan el resultado del procesamiento (forman parte de la clave de caché)"""
+    ancho_mm = ancho_mm or ANCHO_IMPRESO_MM[_tipo_captura(ruta)]
+    return {
+        'ancho_px': round(ancho_mm / 25.4 * dpi),
+        'dpi': dpi,
+        'calidad': CALIDAD_JPEG,
+        'formato': 'JPEG',
+    }
+
+
+def _clave_cache(ruta, ajustes):
+    """Hash del archivo de origen y de los ajustes"""
+    sha = hashlib.sha256()
+    with open(ruta, 'rb') as archivo:
+        sha.update(archivo.read())
+    sha.update(json.dumps(ajustes, sort_keys=True).encode('utf-8'))
+    return sha.hexdigest()[:16]
+
+
+def _slug(ruta):
+    """Nombre de archivo sin espacios para la captura procesada"""
+    base = os.path.splitext(os.path.basename(ruta))[0]
+    return re.sub(r'[^A-Za-z0-9]+', '-', base).strip('-').lower()
+
+
+def procesar_captura(ruta, ajustes, destino):
+    """Redimensiona al tamaño impreso, aplana la transparencia y guarda como JPEG sin metadatos"""
+
+    with Image.open(ruta) as imagen:
+        ancho_original, alto_original = imagen.size
+
+        # Convertir antes de redimensionar (con imágenes en modo paleta o de 1 bit
+        # Pillow usa NEAREST en vez de LANCZOS). JPEG no admite transparencia,
+        # así que se compone sobre fondo blanco
+        if imagen.mode in ('RGBA', 'LA', 'PA') or 'transparency' in imagen.info:
+            imagen = imagen.convert('RGBA')
+            fondo = Image.new('RGB', imagen.size, (255, 255, 255))
+            fondo.paste(imagen, mask=imagen.getchannel('A'))
+            imagen = fondo
+        else:
+            imagen = imagen.convert('RGB')
+
+        # Nunca agrandar: solo reducir capturas más grandes que su caja impresa
+        if ancho_original > ajustes['ancho_px']:
+            alto = round(alto_original * ajustes['ancho_px'] / ancho_original)
+            imagen = imagen.resize((ajustes['ancho_px'], alto), Image.LANCZOS)
+
+        # Sin EXIF, perfil ICC ni textos PNG
+        imagen.info = {}
+        temporal = destino + ".tmp"
+        imagen.save(
+            temporal,
+            ajustes['formato'],
+            quality=ajustes['calidad'],
+            optimize=True,
+            dpi=(ajustes['dpi'], ajustes['dpi'])
+        )
+        os.replace(temporal, destino)
+
+        return {
+            'origen': ruta,
+            'archivo': destino,
+            'dimensiones_origen': [ancho_original, alto_original],
+            'dimensiones': list(imagen.size),
+            'ancho_objetivo_px': ajustes['ancho_px'],
+            'bytes_origen': os.path.getsize(ruta),
+            'bytes': os.path.getsize(destino),
+        }
+
+
+def procesar_capturas(dpi=DPI_OBJETIVO, archivos_html=()):
+    """Procesa todas las capturas en paralelo, reutilizando las ya procesadas con los mismos ajustes"""
+
+    try:
+        capturas = sorted({ruta for patron in PATRONES_CAPTURAS for ruta in glob.glob(patron)})
+        if not capturas:
+            print("Error: No se encontraron capturas para procesar")
+            return None
+
+        os.makedirs(CARPETA_SALIDA, exist_ok=True)
+        print(f"🔍 Encontradas {len(capturas)} capturas (objetivo: {dpi} DPI)")
+
+        anchos_html = anchos_impresos_html(archivos_html)
+        print(f"📐 Ancho impreso leído del HTML: {len(anchos_html)} | "
+              f"Supuesto por nombre de archivo: {len(capturas) - len(set(anchos_html) & set(capturas))}")
+
+        anterior = {}
+        if os.path.exists(ARCHIVO_MANIFIESTO):
+            with open(ARCHIVO_MANIFIESTO, 'r', encoding='utf-8') as file:
+                anterior = json.load(file)
+
+        manifiesto = {}
+        pendientes = []
+        for ruta in capturas:
+            ajustes = _ajustes(ruta, dpi, anchos_html.get(os.path.relpath(ruta)))
+            destino = os.path.join(CARPETA_SALIDA, f"{_slug(ruta)}-{_clave_cache(ruta, ajustes)}.jpg")
+            if os.path.exists(destino) and anterior.get(ruta, {}).get('archivo') == destino:
+                manifiesto[ruta] = anterior[ruta]
+            else:
+                pendientes.append((ruta, ajustes, destino))
+
+        print(f"♻️  En caché: {len(manifiesto)} | Por procesar: {len(pendientes)}")
+
+        inicio = time.perf_counter()
+        if pendientes:
+            with ProcessPoolExecutor() as pool:
+                futuros = [pool.submit(procesar_captura, *pendiente) for pendiente in pendientes]
+                for futuro in futuros:
+                    resultado = futuro.result()
+                    manifiesto[resultado['origen']] = resultado
+                    print(f"   🖼️  {resultado['origen']}: "
+                          f"{resultado['dimensiones_origen'][0]}x{resultado['dimensiones_origen'][1]} → "
+                          f"{resultado['dimensiones'][0]}x{resultado['dimensiones'][1]}, "
+                          f"{resultado['bytes_origen']:,} → {resultado['bytes']:,} bytes")
+        duracion = time.perf_counter() - inicio
+
+        with open(ARCHIVO_MANIFIESTO, 'w', encoding='utf-8') as file:
+            json.dump(manifiesto, file, ensure_ascii=False, indent=2)
+
+        # Eliminar las salidas de ajustes o capturas anteriores que ya no están en el manifiesto
+        vigentes = {entrada['archivo'] for entrada in manifiesto.values()}
+        obsoletas = [ruta for ruta in glob.glob(os.path.join(CARPETA_SALIDA, "*.jpg")) if ruta not in vigentes]
+        for ruta in obsoletas:
+            os.remove(ruta)
+        if obsoletas:
+            print(f"🗑️  Eliminadas {len(obsoletas)} capturas procesadas obsoletas")
+
+        bytes_origen = sum(os.path.getsize(ruta) for ruta in manifiesto)
+        bytes_salida = sum(os.path.getsize(entrada['archivo']) for entrada in manifiesto.values())
+        print(f"✅ Capturas procesadas en {duracion:.2f} s")
+        print(f"📊 Tamaño total: {bytes_origen:,} → {bytes_salida:,} bytes")
+        print(f"📁 Manifiesto: {ARCHIVO_MANIFIESTO}")
+
+        return manifiesto
+
+    except Exception as e:
+        print(f"❌ Error al procesar las capturas: {str(e)}")
+        return None
+
+
+def usar_capturas_procesadas(archivo_html, manifiesto):
+    """Escribe una copia del HTML que referencia las capturas procesadas; el original no se modifica"""
+
+    try:
+        if not os.path.exists(archivo_html):
+            print(f"Error: No se encontró el archivo {archivo_html}")
+            return False
+
+        with open(archivo_html, 'r', encoding='utf-8') as file:
+            contenido = file.read()
+
+        reemplazos = 0
+        for origen, entrada in manifiesto.items():
+            # Las rutas pueden aparecer tal cual o codificadas como URL ("Captura%20movil%201.png")
+            for variante in {origen, quote(origen)}:
+                patron = r'(src=["\'])' + re.escape(variante) + r'(["\'])'
+                contenido, cantidad = re.subn(
+                    patron,
+                    lambda m: m.group(1) + entrada['archivo'].replace(os.sep, '/') + m.group(2),
+                    contenido
+                )
+                reemplazos += cantidad
+
+        if not reemplazos:
+            print(f"⚠️  {archivo_html} no referencia ninguna captura por ruta, no se generó copia")
+            return True
+
+        # Junto al original, para que las rutas relativas sigan siendo válidas
+        archivo_salida = os.path.splitext(archivo_html)[0] + "_capturas.html"
+        with open(archivo_salida, 'w', encoding='utf-8') as file:
+            file.write(contenido)
+
+        print(f"✅ {archivo_salida}: {reemplazos} referencias a capturas procesadas")
+        return True
+
+    except Exception as e:
+        print(f"❌ Error al generar el HTML: {str(e)}")
+        return False
+
+
+if __name__ == "__main__":
+    dpi = DPI_OBJETIVO
+    archivos_html = []
+    argumentos = iter(sys.argv[1:])
+    for argumento in argumentos:
+        if argumento == '--dpi':
+            dpi = int(next(argumentos))
+        elif argumento == '--html':
+            archivos_html.append(next(argumentos))
+
+    print("🚀 Procesando capturas de pantalla para los manuales...")
+    print("-" * 60)
+
+    manifiesto = procesar_capturas(dpi, archivos_html)
+    exito = manifiesto is not None
+    if exito:
+        for archivo_html in archivos_html:
+            exito = usar_capturas_procesadas(archivo_html, manifiesto) and exito
+
+    print("-" * 60)
+    if exito:
+        print("🎉 ¡Proceso completado exitosamente!")
+    else:
+        print("❌ El proceso falló. Revisa los errores arriba.")
@@ -6,8 +6,11 @@ Script avanzado para quitar solo los logos del PDF manteniendo el diseño origin
 import fitz  # PyMuPDF
 import os
 import re
+import sys
+from linealizar_pdf import linealizar_pdf
+from guardado_incremental import guardar_incremental, guardar_pdf_completo
 
-def quitar_logos_del_pdf():
+def quitar_logos_del_pdf(linealizar=False, incremental=False, medir=False):
     """Quita los logos del PDF manteniendo el diseño original"""
     
     # Rutas de archivos
@@ -90,9 +93,19 @@ def quitar_logos_del_pdf():
         
         # Guardar el PDF modificado
         print("💾 Guardando el PDF modificado...")
-        doc.save(archivo_original)  # Sobrescribir el archivo original
+        if incremental:
+            # Solo la portada cambió: agregar sus objetos al final del archivo
+            if not guardar_incremental(doc, archivo_original, medir=medir):
+                print("⚠️  Se guardó con una reescritura completa en lugar de incremental")
+        else:
+            guardar_pdf_completo(doc, archivo_original)  # Sobrescribir el archivo original
         doc.close()
         
+        # MuPDF ya no soporta linear=True al guardar, se post-procesa el archivo
+        if linealizar and not linealizar_pdf(archivo_original):
+            print("❌ Error: No se pudo linealizar el PDF")
+            return False
+        
         print(f"🎉 ¡Manual modificado exitosamente!")
         print(f"📁 Archivo modificado: {archivo_original}")
         print(f"🎨 Se mantuvo el diseño original con fondo morado")
@@ -104,7 +117,7 @@ def quitar_logos_del_pdf():
         print(f"❌ Error al modificar el manual: {str(e)}")
         return False
 
-def metodo_alternativo():
+def metodo_alternativo(linealizar=False, incremental=False, medir=False):
     """Método alternativo usando redraw de la página"""
     
     archivo_original = "Manual_Usuario_EspacioDeportivoBordeRio.pdf"
@@ -136,9 +149,17 @@ def metodo_alternativo():
         # Agregar el contenido principal (título, etc.) sin los logos
         # Esto requeriría más análisis del contenido original
         
-        doc.save(archivo_original)
+        if incremental:
+            if not guardar_incremental(doc, archivo_original, medir=medir):
+                print("⚠️  Se guardó con una reescritura completa en lugar de incremental")
+        else:
+            guardar_pdf_completo(doc, archivo_original)
         doc.close()
         
+        if linealizar and not linealizar_pdf(archivo_original):
+            print("❌ Error: No se pudo linealizar el PDF")
+            return False
+        
         print("✅ Método alternativo completado")
         return True
         
@@ -147,18 +168,28 @@ def metodo_alternativo():
         return False
 
 if __name__ == "__main__":
+    linealizar = '--linearize' in sys.argv
+    incremental = '--incremental' in sys.argv
+    medir = '--medir' in sys.argv
+    
+    if incremental and linealizar:
+        # Una actualización incremental invalida la linealización del archivo
+        print("⚠️  --linearize se ignora en modo incremental")
+        print("💡 Linealiza al compactar: python guardado_incremental.py --compact --linearize")
+        linealizar = False
+    
     print("🚀 Iniciando eliminación de logos del Manual de Usuario...")
     print("🎨 Manteniendo el diseño original con fondo morado...")
     print("-" * 60)
     
-    if quitar_logos_del_pdf():
+    if quitar_logos_del_pdf(linealizar=linealizar, incremental=incremental, medir=medir):
         print("-" * 60)
         print("🎉 ¡Proceso completado exitosamente!")
         print("💡 Los logos han sido eliminados manteniendo el diseño original.")
     else:
         print("-" * 60)
         print("🔄 Intentando método alternativo...")
-        if metodo_alternativo():
+        if metodo_alternativo(linealizar=linealizar, incremental=incremental, medir=medir):
             print("🎉 ¡Proceso completado con método alternativo!")
         else:
             print("❌ Ambos métodos fallaron. Revisa los errores arriba.")
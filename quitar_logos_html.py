@@ -6,6 +6,27 @@ Script para quitar los logos del HTML manteniendo el diseño original
 import os
 import re
 
+def quitar_logos_del_contenido(contenido):
+    """Quita los logos de la portada de un HTML ya leído y devuelve el HTML resultante"""
+    
+    # Eliminar el primer logo (New Life)
+    contenido = re.sub(
+        r'        <!-- Logo ReservaTusCanchas \(izquierda\) -->\s*\n\s*<img src="data:image/png;base64,[^"]*"[^>]*>\s*\n',
+        '',
+        contenido,
+        flags=re.MULTILINE
+    )
+    
+    # Eliminar el segundo logo (Espacio Borde Río)
+    contenido = re.sub(
+        r'        <!-- Logo Espacio Deportivo Borde Río \(derecha\) -->\s*\n\s*<img src="data:image/png;base64,[^"]*"[^>]*>\s*\n',
+        '',
+        contenido,
+        flags=re.MULTILINE
+    )
+    
+    return contenido
+
 def quitar_logos_del_html():
     """Quita los logos del HTML manteniendo todo el diseño original"""
     
@@ -34,22 +55,7 @@ def quitar_logos_del_html():
         
         # Eliminar los logos específicos
         print("🗑️  Eliminando logos...")
-        
-        # Eliminar el primer logo (New Life)
-        contenido = re.sub(
-            r'        <!-- Logo ReservaTusCanchas \(izquierda\) -->\s*\n\s*<img src="data:image/png;base64,[^"]*"[^>]*>\s*\n',
-            '',
-            contenido,
-            flags=re.MULTILINE
-        )
-        
-        # Eliminar el segundo logo (Espacio Borde Río)
-        contenido = re.sub(
-            r'        <!-- Logo Espacio Deportivo Borde Río \(derecha\) -->\s*\n\s*<img src="data:image/png;base64,[^"]*"[^>]*>\s*\n',
-            '',
-            contenido,
-            flags=re.MULTILINE
-        )
+        contenido = quitar_logos_del_contenido(contenido)
         
         # Verificar que se eliminaron los logos
         logos_restantes = len(re.findall(r'<img src="data:image/png;base64,', contenido))
@@ -4,6 +4,7 @@ Script para quitar logos manteniendo el diseño original con fondo morado
 """
 
 import os
+import sys
 from PyPDF2 import PdfReader, PdfWriter
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
@@ -12,6 +13,7 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 import io
+from linealizar_pdf import linealizar_pdf
 
 def crear_portada_morada_sin_logos():
     """Crea una portada con fondo morado sin logos, manteniendo el diseño original"""
@@ -111,7 +113,56 @@ def crear_portada_morada_sin_logos():
     buffer.seek(0)
     return buffer
 
-def modificar_manual_manteniendo_diseno():
+def reemplazar_portada_incremental(archivo_pdf, medir=False):
+    """Reemplaza solo la portada agregando los objetos nuevos al final del PDF existente"""
+    
+    # PyPDF2 no soporta actualizaciones incrementales; PyMuPDF sí
+    import fitz  # PyMuPDF
+    from guardado_incremental import guardar_incremental
+    
+    archivo_backup = "Manual_Usuario_EspacioDeportivoBordeRio_backup_original.pdf"
+    
+    try:
+        if not os.path.exists(archivo_pdf):
+            print(f"Error: No se encontró el archivo {archivo_pdf}")
+            return False
+        
+        print("📖 Abriendo el PDF original...")
+        doc = fitz.open(archivo_pdf)
+        
+        print("🎨 Creando nueva portada con fondo morado (sin logos)...")
+        portada = fitz.open("pdf", crear_portada_morada_sin_logos().getvalue())
+        
+        # En modo incremental la versión anterior queda intacta dentro del archivo;
+        # si el PDF no lo admite se reescribe completo y hace falta el backup
+        if not doc.can_save_incrementally():
+            print("📋 Creando backup del archivo original...")
+            with open(archivo_pdf, 'rb') as original, open(archivo_backup, 'wb') as backup:
+                backup.write(original.read())
+            print(f"📁 Archivo original respaldado en: {archivo_backup}")
+        
+        print("📄 Reemplazando la portada...")
+        doc.delete_page(0)
+        doc.insert_pdf(portada, from_page=0, to_page=0, start_at=0)
+        portada.close()
+        
+        print("💾 Guardando el PDF de forma incremental...")
+        if not guardar_incremental(doc, archivo_pdf, medir=medir):
+            print("⚠️  Se guardó con una reescritura completa en lugar de incremental")
+        total_paginas = len(doc)
+        doc.close()
+        
+        print(f"✅ Manual modificado exitosamente!")
+        print(f"📁 Archivo modificado: {archivo_pdf}")
+        print(f"📄 Total de páginas en el manual modificado: {total_paginas}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error al modificar el manual: {str(e)}")
+        return False
+
+def modificar_manual_manteniendo_diseno(linealizar=False):
     """Modifica el manual manteniendo el diseño original pero sin logos"""
     
     # Rutas de archivos
@@ -153,6 +204,11 @@ def modificar_manual_manteniendo_diseno():
         with open(archivo_modificado, 'wb') as output_file:
             writer.write(output_file)
         
+        # PyPDF2 no puede linealizar, se post-procesa el archivo guardado
+        if linealizar and not linealizar_pdf(archivo_modificado):
+            print("❌ Error: No se pudo linealizar el PDF")
+            return False
+        
         print(f"✅ Manual modificado exitosamente!")
         print(f"📁 Archivo original respaldado en: {archivo_backup}")
         print(f"📁 Archivo modificado: {archivo_modificado}")
@@ -172,11 +228,24 @@ if __name__ == "__main__":
     print("🗑️  Eliminando solo los logos de New Life y Espacio Borde Río...")
     print("-" * 60)
     
-    if modificar_manual_manteniendo_diseno():
+    if '--incremental' in sys.argv:
+        if '--linearize' in sys.argv:
+            # Una actualización incremental invalida la linealización del archivo
+            print("⚠️  --linearize se ignora en modo incremental")
+            print("💡 Linealiza al compactar: python guardado_incremental.py --compact --linearize")
+        exito = reemplazar_portada_incremental(
+            "Manual_Usuario_EspacioDeportivoBordeRio.pdf",
+            medir='--medir' in sys.argv
+        )
+    else:
+        exito = modificar_manual_manteniendo_diseno(linealizar='--linearize' in sys.argv)
+    
+    if exito:
         print("-" * 60)
         print("🎉 ¡Proceso completado exitosamente!")
         print("💡 El manual ahora tiene fondo morado sin logos.")
-        print("📋 El archivo original está respaldado por seguridad.")
+        if '--incremental' not in sys.argv:
+            print("📋 El archivo original está respaldado por seguridad.")
     else:
         print("-" * 60)
         print("❌ El proceso falló. Revisa los errores arriba.")